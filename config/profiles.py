@@ -0,0 +1,114 @@
+"""Environment performance profiles for the test automation framework.
+
+A profile bundles everything that trades speed against debuggability, so one
+switch (`--perf-profile` or the `PERF_PROFILE` environment variable) picks the
+whole configuration.
+"""
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple, Union
+
+# Environment variable used to select a profile when no CLI option is given
+PROFILE_ENV_VAR = "PERF_PROFILE"
+DEFAULT_PROFILE = "default"
+
+# Playwright's own defaults, scaled by `timeout_scale`
+BASE_ACTION_TIMEOUT_MS = 30000
+BASE_EXPECT_TIMEOUT_MS = 5000
+
+
+@dataclass(frozen=True)
+class ArtifactPolicy:
+    """What to capture per test.
+
+    `screenshot` is 'off', 'on' or 'only-on-failure'; `video` and `tracing` are
+    'off', 'on' or 'retain-on-failure'.
+    """
+
+    screenshot: str = "off"
+    video: str = "off"
+    tracing: str = "off"
+    output_dir: str = "test-results"
+
+
+@dataclass(frozen=True)
+class PerformanceProfile:
+    """Browser, parallelism and timing settings for one environment.
+
+    `--headed` can only turn a headless profile headed, and `--slowmo` only
+    applies when non-zero: no CLI flag makes a headed profile headless or
+    removes a profile's `slow_mo`. Pick another profile for that.
+    """
+
+    name: str
+    headless: bool = True
+    slow_mo: int = 0
+    launch_args: Tuple[str, ...] = ()
+    viewport: Dict[str, int] = field(default_factory=lambda: {"width": 1280, "height": 720})
+    # pytest-xdist worker count ('auto' for one per CPU); None runs in-process
+    workers: Optional[Union[int, str]] = None
+    artifacts: ArtifactPolicy = ArtifactPolicy()
+    # URL regex aborted at the context level. Registering any route turns off the
+    # HTTP cache for the context, so app bundles are refetched in every test; only
+    # use it where a timing run shows it pays off.
+    blocked_urls: Optional[str] = None
+    timeout_scale: float = 1.0
+    virtual_clock: bool = False
+
+    @property
+    def action_timeout(self) -> float:
+        """Default timeout for Playwright actions in ms."""
+        return BASE_ACTION_TIMEOUT_MS * self.timeout_scale
+
+    @property
+    def expect_timeout(self) -> float:
+        """Default timeout for `expect` assertions in ms."""
+        return BASE_EXPECT_TIMEOUT_MS * self.timeout_scale
+
+
+PROFILES: Dict[str, PerformanceProfile] = {
+    # Local runs: headed, everything else at Playwright defaults
+    "default": PerformanceProfile(name="default", headless=False),
+    # CI: headless, parallel, no animations. No URL blocking, which would turn off
+    # the HTTP cache (see `blocked_urls`)
+    "ci-fast": PerformanceProfile(
+        name="ci-fast",
+        headless=True,
+        launch_args=("--disable-gpu", "--disable-dev-shm-usage", "--disable-extensions"),
+        workers="auto",
+        artifacts=ArtifactPolicy(screenshot="only-on-failure"),
+        virtual_clock=True,
+    ),
+    # Debugging a failure: headed, slowed down, full artifacts, generous timeouts
+    "debug": PerformanceProfile(
+        name="debug",
+        headless=False,
+        slow_mo=100,
+        artifacts=ArtifactPolicy(screenshot="on", video="on", tracing="on"),
+        timeout_scale=3.0,
+    ),
+    # Long-running stability runs: headless, parallel, evidence kept for failures
+    # only; fonts and media are blocked to keep memory flat (HTTP cache is off)
+    "soak": PerformanceProfile(
+        name="soak",
+        headless=True,
+        launch_args=("--disable-dev-shm-usage",),
+        workers=4,
+        artifacts=ArtifactPolicy(screenshot="only-on-failure", tracing="retain-on-failure"),
+        blocked_urls=r"\.(woff2?|ttf|otf|mp4|webm)(\?|$)",
+        timeout_scale=2.0,
+    ),
+}
+
+
+def get_profile(name: Optional[str] = None) -> PerformanceProfile:
+    """Returns the named profile, falling back to `PERF_PROFILE` and then the default.
+
+    Raises:
+        ValueError: If the profile name is unknown
+    """
+    name = name or os.environ.get(PROFILE_ENV_VAR) or DEFAULT_PROFILE
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unknown performance profile '{name}'. Available: {', '.join(PROFILES)}") from None
@@ -1,12 +1,86 @@
 import re
 from typing import List, Dict, Optional
 from playwright.sync_api import Page, Locator, expect
+from utils.virtual_clock import advance
+
+# Fills every form field in a single in-page call. Values are written through the
+# native value setters so React's onChange sees them, and the script yields to the
+# event loop between steps so React commits each update before the next one.
+# The yield uses MessageChannel rather than setTimeout so it does not depend on
+# the page's timers, which tests may fake.
+_FAST_FILL_SCRIPT = """
+async ({ fields, category, colorIndex, selectedColorMark, verify }) => {
+    const tick = () => new Promise(resolve => {
+        const channel = new MessageChannel();
+        channel.port1.onmessage = resolve;
+        channel.port2.postMessage(null);
+    });
+    const setValue = (el, value) => {
+        const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+        Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+        el.dispatchEvent(new Event('input', { bubbles: true }));
+        el.dispatchEvent(new Event('change', { bubbles: true }));
+    };
+
+    for (const [selector, value] of fields) {
+        const el = document.querySelector(selector);
+        if (!el) return { error: `Field not found: ${selector}` };
+        setValue(el, value);
+    }
+    await tick();
+
+    const combobox = document.querySelector('div[role="combobox"]');
+    if (category) {
+        if (!combobox) return { error: 'Category selector not found' };
+        combobox.dispatchEvent(new MouseEvent('mousedown', { bubbles: true, button: 0 }));
+        await tick();
+        const option = [...document.querySelectorAll('li[role="option"]')]
+            .find(li => li.textContent.trim().includes(category));
+        if (!option) return { error: `Category not found: ${category}` };
+        option.click();
+        await tick();
+        // A multi-select menu stays open; the option itself may be detached by now
+        const listbox = document.querySelector('ul[role="listbox"]');
+        if (listbox) {
+            listbox.dispatchEvent(new KeyboardEvent('keydown', { key: 'Escape', bubbles: true }));
+            await tick();
+        }
+    }
+
+    const colorButtons = () => [...document.querySelectorAll('button[id^="color-element-"]')];
+    if (!colorButtons()[colorIndex]) return { error: `Color not found: ${colorIndex}` };
+    colorButtons()[colorIndex].click();
+    await tick();
+
+    if (verify) {
+        // A controlled input re-renders from React state, so a rejected value reverts
+        const mismatches = fields
+            .filter(([selector, value]) => document.querySelector(selector).value !== value)
+            .map(([selector]) => selector);
+        if (category && !combobox.textContent.includes(category)) mismatches.push('category');
+        // Re-query: the buttons re-render, and only the selected one carries the mark
+        const marked = colorButtons()
+            .map((button, index) => button.querySelector(selectedColorMark) ? index : -1)
+            .filter(index => index >= 0);
+        if (marked.length !== 1 || marked[0] !== colorIndex) mismatches.push('color');
+        if (mismatches.length) return { mismatches };
+    }
+
+    const createButton = [...document.querySelectorAll('button')]
+        .find(button => button.textContent.trim() === 'Create Task');
+    if (!createButton) return { error: 'Create Task button not found' };
+    createButton.click();
+    return {};
+}
+"""
 
 class AddTaskPage:
     """Page Object for the Add Task page of the React Cool Todo App."""
 
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, virtual_clock: bool = False):
         self.page = page
+        # When the virtual clock is installed, fixed waits are fast-forwarded
+        self.virtual_clock = virtual_clock
 
         # --- Core Locators ---
         self.back_button: Locator = page.locator('button[aria-label="Back"]')
@@ -25,10 +99,17 @@ class AddTaskPage:
         self.color_accordion_summary: Locator = page.locator('.MuiAccordionSummary-root')
         self.color_grid: Locator = page.locator('.MuiGrid-container .MuiGrid-spacing-xs-1')
         self.color_buttons: Locator = page.locator('button[id^="color-element-"]')
+        # The selected color button renders a check icon
+        self.selected_color_mark_selector = 'svg'
         
         # Create Task button
         self.create_task_button: Locator = page.locator('button:text("Create Task")')
 
+        # Raw CSS selectors for the fast in-page form fill
+        self.task_name_selector = 'input[name="name"][placeholder="Enter task name"]'
+        self.task_description_selector = 'textarea[name="name"][placeholder="Enter task description"]'
+        self.task_deadline_selector = 'input[type="datetime-local"]'
+
     def goto(self, base_url: str) -> None:
         """Navigates to the Add Task page."""
         self.page.goto(f"{base_url}/add")
@@ -49,6 +130,15 @@ class AddTaskPage:
         """Sets the task deadline. Format should be YYYY-MM-DDThh:mm."""
         self.task_deadline_input.fill(deadline)
 
+    def select_category(self, category: str) -> None:
+        """Selects a category by its visible name."""
+        self.category_select.click()
+        self.page.locator('li[role="option"]', has_text=category).click()
+        listbox = self.page.locator('ul[role="listbox"]')
+        if listbox.is_visible():
+            self.page.keyboard.press('Escape')  # Close the menu for multi-select
+        expect(self.category_select).to_contain_text(category)
+
     def select_color(self, color_index: int = 0) -> None:
         """Selects a color for the task by index."""
         # Open color accordion if it's not already open
@@ -65,10 +155,76 @@ class AddTaskPage:
         # Wait for navigation to complete
         self.page.wait_for_url("**/")
         # After navigation back to main page, allow caller to assert on specific task
-        self.page.wait_for_timeout(500)  # small pause for UI update
+        advance(self.page, 500, self.virtual_clock)  # small pause for UI update
+
+    def fill_and_create_fast(
+        self,
+        name: str,
+        description: str = "",
+        deadline: str = "",
+        color_index: int = 0,
+        category: Optional[str] = None,
+        verify: bool = False,
+    ) -> None:
+        """Fills all fields and submits the form in a single in-page call.
+
+        Skips Playwright's per-action actionability checks, so it is meant for
+        high-volume setup rather than for testing the form itself.
+
+        Args:
+            name: Task name
+            description: Task description, left untouched if empty
+            deadline: Deadline in YYYY-MM-DDThh:mm format, left untouched if empty
+            color_index: Index of the color to select
+            category: Visible category name to select, if any
+            verify: Check that the fields, category and color took before submitting
+        """
+        fields = [[self.task_name_selector, name]]
+        if description:
+            fields.append([self.task_description_selector, description])
+        if deadline:
+            fields.append([self.task_deadline_selector, deadline])
+
+        result = self.page.evaluate(_FAST_FILL_SCRIPT, {
+            "fields": fields,
+            "category": category,
+            "colorIndex": color_index,
+            "selectedColorMark": self.selected_color_mark_selector,
+            "verify": verify,
+        })
+        if result.get("error"):
+            raise AssertionError(f"Fast form fill failed: {result['error']}")
+        if result.get("mismatches"):
+            raise AssertionError(f"Form state did not take values for: {', '.join(result['mismatches'])}")
+        self.page.wait_for_url("**/")
+
+    def add_complete_task(
+        self,
+        name: str,
+        description: str = "",
+        deadline: str = "",
+        color_index: int = 0,
+        category: Optional[str] = None,
+        fast: bool = False,
+        verify: bool = False,
+    ) -> None:
+        """Adds a complete task with all details.
+
+        With `fast=True` the form is filled and submitted in one in-page call.
+        `verify` checks that every field, the category and the color took before
+        submitting, on either path.
+        """
+        if fast:
+            self.fill_and_create_fast(
+                name,
+                description=description,
+                deadline=deadline,
+                color_index=color_index,
+                category=category,
+                verify=verify,
+            )
+            return
 
-    def add_complete_task(self, name: str, description: str = "", deadline: str = "", color_index: int = 0) -> None:
-        """Adds a complete task with all details."""
         self.fill_task_name(name)
         
         if description:
@@ -76,12 +232,37 @@ class AddTaskPage:
         
         if deadline:
             self.set_task_deadline(deadline)
+
+        if category:
+            self.select_category(category)
         
         self.select_color(color_index)
+
+        if verify:
+            self.expect_form_values(name, description, deadline, category, color_index)
         self.create_task()
 
     # --- Assertions ---
 
+    def expect_form_values(
+        self,
+        name: str,
+        description: str = "",
+        deadline: str = "",
+        category: Optional[str] = None,
+        color_index: int = 0,
+    ) -> None:
+        """Asserts the form holds the given values and only the given color is selected."""
+        expect(self.task_name_input).to_have_value(name)
+        if description:
+            expect(self.task_description_input).to_have_value(description)
+        if deadline:
+            expect(self.task_deadline_input).to_have_value(deadline)
+        if category:
+            expect(self.category_select).to_contain_text(category)
+        expect(self.color_buttons.nth(color_index).locator(self.selected_color_mark_selector)).to_be_visible()
+        expect(self.color_buttons.locator(self.selected_color_mark_selector)).to_have_count(1)
+
     def expect_on_add_task_page(self) -> None:
         """Asserts that we are on the Add Task page."""
         expect(self.page_title).to_be_visible()
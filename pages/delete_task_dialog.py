@@ -1,10 +1,13 @@
 from playwright.sync_api import Page, Locator, expect
+from utils.virtual_clock import advance, fast_forward_transitions
 
 class DeleteTaskDialog:
     """Page object for the delete task confirmation dialog."""
     
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, virtual_clock: bool = False):
         self.page = page
+        # When the virtual clock is installed, fixed waits are fast-forwarded
+        self.virtual_clock = virtual_clock
         
         # Dialog locators - using multiple strategies for reliability
         self._dialog_locators = [
@@ -40,8 +43,9 @@ class DeleteTaskDialog:
     def confirm_delete(self) -> None:
         """Click the confirm delete button."""
         self.wait_for_visible()
-        self.page.wait_for_timeout(500)  # Small delay for visibility
+        advance(self.page, 500, self.virtual_clock)  # Small delay for visibility
         self.confirm_delete_button.click()
+        fast_forward_transitions(self.page, self.virtual_clock)
         
         # Wait for dialog to disappear
         for locator in self._dialog_locators:
@@ -54,8 +58,9 @@ class DeleteTaskDialog:
     def cancel(self) -> None:
         """Click the cancel button."""
         self.wait_for_visible()
-        self.page.wait_for_timeout(500)  # Small delay for visibility
+        advance(self.page, 500, self.virtual_clock)  # Small delay for visibility
         self.cancel_button.click()
+        fast_forward_transitions(self.page, self.virtual_clock)
         
         # Wait for dialog to disappear
         for locator in self._dialog_locators:
@@ -0,0 +1,312 @@
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Generator, List, Optional
+from playwright.sync_api import Page
+
+BINDING_NAME = "__taskListChanged"
+
+# Mirrors the task cards into per-card state and reports changes as diffs. Work is
+# driven by MutationRecords: only cards that were added, removed or changed inside
+# are re-read, so a mutation costs O(changed cards), not O(all cards).
+#
+# A region observer watches the task list (the closest common ancestor of the
+# cards) for card additions, removals and attribute/text changes inside cards. A
+# body observer with childList only (no attributes) locates the region when it
+# mounts, widens it if a card appears outside it, and reports every tracked card
+# as removed when React unmounts it, e.g. on navigating to /add.
+# A 'reset' event is sent whenever the observer starts in a fresh document. Every
+# card gets a stable id for its lifetime, so cards sharing a title stay distinct.
+# Only the top-level document is observed.
+_OBSERVER_SCRIPT = """
+(() => {
+    if (window.__taskListObserver || window !== window.top) return;
+    const CONTAINER = 'div[data-testid="task-container"]';
+    const COMPLETED_ICON = 'svg[data-testid="CheckCircleIcon"]';
+    const cards = new Map();  // card element -> last reported state
+    const ids = new WeakMap();  // card element -> stable id
+    let nextId = 0;
+    let region = null;
+
+    const idOf = card => {
+        if (!ids.has(card)) ids.set(card, ++nextId);
+        return ids.get(card);
+    };
+
+    const read = card => {
+        const titleEl = card.querySelector('h3');
+        return {
+            id: idOf(card),
+            title: titleEl ? titleEl.textContent.trim() : '',
+            completed: !!card.querySelector(COMPLETED_ICON),
+            visible: card.checkVisibility ? card.checkVisibility() : card.offsetParent !== null,
+        };
+    };
+
+    const cardsIn = node => {
+        if (node.nodeType !== Node.ELEMENT_NODE) return [];
+        return node.matches(CONTAINER) ? [node] : [...node.querySelectorAll(CONTAINER)];
+    };
+
+    const update = (card, events) => {
+        const before = cards.get(card);
+        const task = read(card);
+        cards.set(card, task);
+        if (!before) {
+            events.push({ kind: 'added', ...task });
+            return;
+        }
+        if (before.title !== task.title) events.push({ kind: 'renamed', ...task });
+        if (before.completed !== task.completed) events.push({ kind: 'completed', ...task });
+        if (before.visible !== task.visible) events.push({ kind: 'visibility', ...task });
+    };
+
+    const remove = (card, events) => {
+        const before = cards.get(card);
+        if (!before) return;
+        cards.delete(card);
+        events.push({ kind: 'removed', ...before });
+    };
+
+    const send = events => {
+        if (events.length) window.__taskListChanged(events);
+    };
+
+    const onRegionMutations = records => {
+        const changed = new Set();
+        const events = [];
+        for (const record of records) {
+            for (const node of record.removedNodes) {
+                for (const card of cardsIn(node)) if (!card.isConnected) remove(card, events);
+            }
+            for (const node of record.addedNodes) {
+                for (const card of cardsIn(node)) changed.add(card);
+            }
+            const target = record.target.nodeType === Node.ELEMENT_NODE ? record.target : record.target.parentElement;
+            const card = target && target.closest(CONTAINER);
+            if (card) changed.add(card);
+        }
+        for (const card of changed) if (card.isConnected) update(card, events);
+        send(events);
+    };
+    const regionObserver = new MutationObserver(onRegionMutations);
+
+    const attachRegion = newRegion => {
+        regionObserver.disconnect();
+        region = newRegion;
+        regionObserver.observe(region, {
+            childList: true,
+            subtree: true,
+            characterData: true,
+            attributes: true,
+            attributeFilter: ['class', 'style', 'hidden'],
+        });
+        const events = [];
+        for (const card of region.querySelectorAll(CONTAINER)) update(card, events);
+        send(events);
+    };
+
+    const detachRegion = () => {
+        regionObserver.disconnect();
+        const events = [];
+        for (const card of [...cards.keys()]) remove(card, events);
+        region = null;
+        send(events);
+    };
+
+    const commonAncestor = (start, nodes) => {
+        let ancestor = start;
+        for (const node of nodes) while (!ancestor.contains(node)) ancestor = ancestor.parentElement;
+        return ancestor;
+    };
+
+    const locateRegion = (records = []) => {
+        if (region && !region.isConnected) detachRegion();
+        if (!region) {
+            const all = [...document.querySelectorAll(CONTAINER)];
+            if (all.length) attachRegion(commonAncestor(all[0].parentElement, all));
+            return;
+        }
+        const outside = [];
+        for (const record of records) {
+            for (const node of record.addedNodes) {
+                for (const card of cardsIn(node)) if (card.isConnected && !region.contains(card)) outside.push(card);
+            }
+        }
+        if (outside.length) attachRegion(commonAncestor(region, outside));
+    };
+
+    const start = () => {
+        window.__taskListChanged([{ kind: 'reset' }]);
+        window.__taskListObserver = new MutationObserver(locateRegion);
+        window.__taskListObserver.observe(document.body, { childList: true, subtree: true });
+        locateRegion();
+    };
+
+    if (document.body) {
+        start();
+    } else {
+        document.addEventListener('DOMContentLoaded', start);
+    }
+})();
+"""
+
+
+@dataclass
+class TaskState:
+    """Last known state of a rendered task card."""
+
+    id: int
+    title: str
+    completed: bool
+    visible: bool
+
+
+@dataclass
+class TaskChange:
+    """A single change to the rendered task list.
+
+    `kind` is one of 'reset', 'added', 'removed', 'renamed', 'completed' or
+    'visibility'. `id` identifies the card element in the page.
+    """
+
+    kind: str
+    id: int = 0
+    title: str = ""
+    completed: bool = False
+    visible: bool = False
+
+
+class TaskListModel:
+    """Incrementally updated local model of the rendered task list.
+
+    A MutationObserver in the page pushes diffs over an exposed binding, so reads
+    and waits resolve against local state instead of re-querying the DOM. Changes
+    are applied whenever Playwright processes incoming messages; `wait_for` and
+    `changes` let them in while idle.
+
+    Tasks are keyed by a per-card id assigned in the page, so the model holds one
+    entry per `task-container` element, including cards with duplicate or empty
+    titles. Only the main frame's events are applied. Title lookups in the waits match a case-insensitive substring of the card title,
+    like `CoolTodoPage.get_task_locator`, except that they do not look at the
+    rest of the card's text (e.g. the description).
+
+    At most `max_pending` unread change events are kept for `changes`/`drain`;
+    older ones are dropped. The model itself is always complete.
+    """
+
+    def __init__(self, page: Page, max_pending: int = 1000):
+        self.page = page
+        self.tasks: Dict[int, TaskState] = {}
+        self._pending: Deque[TaskChange] = deque(maxlen=max_pending)
+        self._attached = False
+
+    def attach(self) -> None:
+        """Exposes the binding and starts the observer, now and after every reload."""
+        if self._attached:
+            return
+        self.page.expose_binding(BINDING_NAME, self._on_changes)
+        self.page.add_init_script(_OBSERVER_SCRIPT)
+        self.page.evaluate(_OBSERVER_SCRIPT)
+        self._attached = True
+
+    def _on_changes(self, source: Dict, events: List[Dict]) -> None:
+        """Binding callback: applies a batch of changes from the page."""
+        if source.get("frame") is not self.page.main_frame:
+            return  # The init script also runs in child frames
+        for event in events:
+            change = TaskChange(**event)
+            self._apply(change)
+            self._pending.append(change)
+
+    def _apply(self, change: TaskChange) -> None:
+        """Applies a single change to the local model."""
+        if change.kind == "reset":
+            self.tasks.clear()
+        elif change.kind == "removed":
+            self.tasks.pop(change.id, None)
+        else:
+            self.tasks[change.id] = TaskState(change.id, change.title, change.completed, change.visible)
+
+    def _pump(self, interval: int = 50) -> None:
+        """Lets Playwright deliver pending binding calls without touching the DOM."""
+        self.page.wait_for_timeout(interval)
+
+    # --- Reads ---
+
+    def titles(self, visible_only: bool = True) -> List[str]:
+        """Returns the titles of the rendered tasks."""
+        return [t.title for t in self.tasks.values() if t.visible or not visible_only]
+
+    def count(self, visible_only: bool = True) -> int:
+        """Returns the number of rendered task cards."""
+        return len(self.titles(visible_only))
+
+    def get(self, title: str) -> Optional[TaskState]:
+        """Returns the first task with exactly this title, or None if none is rendered."""
+        return next((t for t in self.tasks.values() if t.title == title), None)
+
+    def find(self, text: str) -> Optional[TaskState]:
+        """Returns the first task whose title contains `text`, case-insensitively.
+
+        Prefers a visible task, mirroring how a `has_text` locator is asserted.
+        """
+        needle = " ".join(text.split()).lower()
+        matches = [t for t in self.tasks.values() if needle in " ".join(t.title.split()).lower()]
+        return next((t for t in matches if t.visible), matches[0] if matches else None)
+
+    # --- Waits ---
+
+    def wait_for(self, predicate: Callable[["TaskListModel"], bool], timeout: int = 10000, message: str = "") -> None:
+        """Waits until the predicate holds for the local model."""
+        deadline = time.monotonic() + timeout / 1000
+        while not predicate(self):
+            if time.monotonic() >= deadline:
+                raise AssertionError(message or f"Task list condition not met within {timeout}ms")
+            self._pump()
+
+    def wait_for_task(self, title: str, visible: bool = True, timeout: int = 10000) -> None:
+        """Waits until a task is visible, or hidden/removed when `visible` is False.
+
+        `title` matches a substring of the card title, see `find`.
+        """
+        def condition(model: TaskListModel) -> bool:
+            task = model.find(title)
+            return (task is not None and task.visible) == visible
+        state = "visible" if visible else "hidden"
+        self.wait_for(condition, timeout, f"Task '{title}' not {state} within {timeout}ms")
+
+    def wait_for_completed(self, title: str, is_completed: bool = True, timeout: int = 10000) -> None:
+        """Waits until a task has the given completed state; `title` matches as in `find`."""
+        def condition(model: TaskListModel) -> bool:
+            task = model.find(title)
+            return task is not None and task.completed == is_completed
+        self.wait_for(condition, timeout, f"Task '{title}' completed != {is_completed} within {timeout}ms")
+
+    def wait_for_count(self, count: int, visible_only: bool = True, timeout: int = 10000) -> None:
+        """Waits until the number of rendered tasks equals `count`."""
+        self.wait_for(
+            lambda model: model.count(visible_only) == count,
+            timeout,
+            f"Task count did not reach {count} within {timeout}ms",
+        )
+
+    # --- Change stream ---
+
+    def changes(self, timeout: int = 10000) -> Generator[TaskChange, None, None]:
+        """Yields change events as they arrive; stops after `timeout` ms without one."""
+        deadline = time.monotonic() + timeout / 1000
+        while True:
+            if self._pending:
+                yield self._pending.popleft()
+                deadline = time.monotonic() + timeout / 1000
+            elif time.monotonic() >= deadline:
+                return
+            else:
+                self._pump()
+
+    def drain(self) -> List[TaskChange]:
+        """Returns and clears the change events received so far."""
+        drained = list(self._pending)
+        self._pending.clear()
+        return drained
@@ -2,12 +2,18 @@ import re
 from typing import List, Dict, Optional
 from playwright.sync_api import Page, Locator, expect
 from pages.delete_task_dialog import DeleteTaskDialog
+from pages.task_list_model import TaskListModel
+from utils.virtual_clock import advance, fast_forward_transitions
 
 class CoolTodoPage:
     """Page Object for the React Cool Todo App."""
 
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, virtual_clock: bool = False):
         self.page = page
+        # When the virtual clock is installed, fixed waits are fast-forwarded
+        self.virtual_clock = virtual_clock
+        # Local task list model, set by attach_task_stream()
+        self.task_list: Optional[TaskListModel] = None
 
         # --- Core Locators ---
         # Main page elements
@@ -59,6 +65,19 @@ class CoolTodoPage:
         self.page.goto(base_url)
         expect(self.add_task_button).to_be_visible(timeout=15000)
 
+    def attach_task_stream(self) -> TaskListModel:
+        """Starts mirroring the task list into a local model fed by DOM changes.
+
+        Once attached, waits and assertions on task presence, completion and count
+        resolve against the model instead of re-querying the DOM. Titles then match
+        a case-insensitive substring of the card title only, whereas
+        `get_task_locator` matches anywhere in the card's text.
+        """
+        if self.task_list is None:
+            self.task_list = TaskListModel(self.page)
+            self.task_list.attach()
+        return self.task_list
+
     # --- Actions ---
 
     def navigate_to_add_task_page(self) -> None:
@@ -69,10 +88,12 @@ class CoolTodoPage:
         self.page.wait_for_url("**/add", timeout=15000)
         expect(self.page.locator('h2:text("Add New Task")')).to_be_visible(timeout=10000)
 
-    def add_task(self, title: str, description: str = '') -> None:
+    def add_task(self, title: str, description: str = '', fast: bool = False) -> None:
         """Adds a new task by navigating to the Add Task page.
         
-        Note: This method uses the AddTaskPage object internally.
+        Note: This method uses the AddTaskPage object internally. With `fast=True`
+        the form is filled and submitted in a single in-page call. With the task
+        stream attached, the new task is awaited by card title only.
         """
         from pages.add_task_page import AddTaskPage
         
@@ -80,17 +101,19 @@ class CoolTodoPage:
         self.navigate_to_add_task_page()
         
         # Use the AddTaskPage to add the task
-        add_task_page = AddTaskPage(self.page)
-        add_task_page.add_complete_task(title, description)
+        add_task_page = AddTaskPage(self.page, virtual_clock=self.virtual_clock)
+        add_task_page.add_complete_task(title, description, fast=fast)
         
         # We should now be back on the main page, verify specific task
-        if title:
+        if title and self.task_list is not None:
+            self.task_list.wait_for_task(title, timeout=10000)
+        elif title:
             expect(self.get_task_locator(title)).to_be_visible(timeout=10000)
 
-    def add_tasks(self, tasks: List[Dict[str, str]]) -> None:
+    def add_tasks(self, tasks: List[Dict[str, str]], fast: bool = False) -> None:
         """Adds multiple tasks."""
         for task in tasks:
-            self.add_task(task.get('title', ''), task.get('description', ''))
+            self.add_task(task.get('title', ''), task.get('description', ''), fast=fast)
 
     def get_task_locator(self, title: str) -> Locator:
         """Returns the locator for a specific task card by its title."""
@@ -103,7 +126,7 @@ class CoolTodoPage:
         # Use force click in case it's not interactable until visible
         container.locator(self.task_menu_button_selector).click(force=True)
         expect(self.page.locator('ul[role="menu"]')).to_be_visible()
-        self.page.wait_for_timeout(100) # Small delay for menu animation
+        advance(self.page, 100, self.virtual_clock) # Small delay for menu animation
 
     def complete_task(self, task_title: str) -> None:
         """Marks a task as completed via its menu."""
@@ -146,13 +169,13 @@ class CoolTodoPage:
              return # Avoid error if task already gone
 
         # Add explicit wait before opening menu
-        self.page.wait_for_timeout(500)  # 500ms pause for visibility
+        advance(self.page, 500, self.virtual_clock)  # 500ms pause for visibility
         self.open_task_menu(task_title)
-        self.page.wait_for_timeout(500)  # 500ms pause for visibility
+        advance(self.page, 500, self.virtual_clock)  # 500ms pause for visibility
         self.menu_delete_item.click()
 
         # Use the DeleteTaskDialog page object to handle the confirmation
-        delete_dialog = DeleteTaskDialog(self.page)
+        delete_dialog = DeleteTaskDialog(self.page, virtual_clock=self.virtual_clock)
         
         if confirm:
             # Confirm deletion
@@ -187,28 +210,31 @@ class CoolTodoPage:
     def search_tasks(self, search_term: str) -> None:
         """Enters text into the search bar."""
         self.search_input.fill(search_term)
-        self.page.wait_for_timeout(500) # Wait for filtering debounce/render
+        advance(self.page, 500, self.virtual_clock) # Wait for filtering debounce/render
 
     def clear_search(self) -> None:
         """Clears the search bar."""
         self.search_input.clear()
-        self.page.wait_for_timeout(500)
+        advance(self.page, 500, self.virtual_clock)
 
     def purge_all_tasks(self) -> None:
         """Opens sidebar and clicks Purge Tasks, confirms deletion."""
         self.sidebar_button.click()
+        fast_forward_transitions(self.page, self.virtual_clock)
         expect(self.sidebar_menu).to_be_visible()
         self.sidebar_purge_tasks_link.click()
 
         # Confirmation modal for purge
         expect(self.confirm_purge_dialog).to_be_visible()
         self.confirm_purge_button.click()
+        fast_forward_transitions(self.page, self.virtual_clock)
 
         expect(self.confirm_purge_dialog).to_be_hidden()
         expect(self.task_containers).to_have_count(0, timeout=10000)
 
         # Close sidebar (optional, click away or find close button)
         self.page.keyboard.press('Escape') # Try Escape first
+        fast_forward_transitions(self.page, self.virtual_clock)
         expect(self.sidebar_menu).to_be_hidden(timeout=5000)
 
     # --- Assertions ---
@@ -242,6 +268,9 @@ class CoolTodoPage:
 
     def expect_total_task_cards(self, count: int) -> None:
         """Asserts the number of visible task card elements."""
+        if self.task_list is not None:
+            self.task_list.wait_for_count(count, visible_only=False)
+            return
         expect(self.task_containers).to_have_count(count)
         
     def get_visible_task_count(self) -> int:
@@ -259,11 +288,23 @@ class CoolTodoPage:
             expect(task_locator.locator(self.task_description_selector)).to_contain_text(description)
 
     def expect_task_hidden(self, title: str) -> None:
-        """Asserts a task with the given title is hidden."""
+        """Asserts a task with the given title is hidden.
+
+        With the task stream attached, `title` is matched against card titles only.
+        """
+        if self.task_list is not None:
+            self.task_list.wait_for_task(title, visible=False)
+            return
         expect(self.get_task_locator(title)).to_be_hidden()
 
     def expect_task_completed(self, title: str, is_completed: bool = True) -> None:
-        """Asserts the visual completed state of a task."""
+        """Asserts the visual completed state of a task.
+
+        With the task stream attached, `title` is matched against card titles only.
+        """
+        if self.task_list is not None:
+            self.task_list.wait_for_completed(title, is_completed)
+            return
         task_item = self.get_task_locator(title)
         completed_icon = task_item.locator(self.task_completed_icon_selector)
         if is_completed:
@@ -320,7 +361,7 @@ class CoolTodoPage:
                      print(f"Deleting task: {task_title}")
                      self.delete_task(task_title, confirm=True)
                      # Add a small wait to allow UI to update before next iteration
-                     self.page.wait_for_timeout(300)
+                     advance(self.page, 300, self.virtual_clock)
                      count_after = self.task_containers.count()
                      print(f"Tasks remaining after delete: {count_after}")
                      if count_after >= count_before:
@@ -345,7 +386,7 @@ class CoolTodoPage:
         expect(self.add_task_button).to_be_visible(timeout=20000) # Increased timeout after reload
         # Wait for either the count or the empty message
         expect(self.task_count_text.or_(self.no_tasks_message)).to_be_visible(timeout=15000)
-        self.page.wait_for_timeout(500) # Extra small wait for stability
+        advance(self.page, 500, self.virtual_clock) # Extra small wait for stability
         print("Page reloaded after clearing storage.")
 
     def click_add_task_button(self) -> None:
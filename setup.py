@@ -11,7 +11,7 @@ setup(
     install_requires=[
         "pytest>=7.4.0",
         "pytest-playwright>=0.4.3",
-        "playwright>=1.40.0",
+        "playwright>=1.45.0",
         "pytest-xdist>=3.3.1",
         "pytest-html>=4.1.1",
         "ruff>=0.1.6",
@@ -1,17 +1,104 @@
+import re
 import pytest
+from pathlib import Path
 from typing import Dict, Generator
-from playwright.sync_api import Browser, BrowserContext, Page, Playwright, sync_playwright
+from playwright.sync_api import Browser, BrowserContext, Page, Playwright, expect, sync_playwright
+from config.profiles import PROFILE_ENV_VAR, PROFILES, PerformanceProfile, get_profile
+from utils.virtual_clock import install_virtual_clock
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register framework command line options."""
+    parser.addoption(
+        "--virtual-clock",
+        action="store_true",
+        default=False,
+        help="Install Playwright's clock and disable CSS transitions/animations so UI waits are fast-forwarded.",
+    )
+    parser.addoption(
+        "--perf-profile",
+        default=None,
+        choices=list(PROFILES),
+        help=f"Performance profile from config/profiles.py (default: ${PROFILE_ENV_VAR} or 'default').",
+    )
+    parser.addoption(
+        "--profile-task-counts",
+        default="0,50,200",
+        help="Comma-separated task list sizes for the selector profiling run (-m profiling).",
+    )
+
+def _selected_profile(config: pytest.Config) -> PerformanceProfile:
+    """Resolve the performance profile from the CLI option or environment."""
+    try:
+        return get_profile(config.getoption("perf_profile"))
+    except ValueError as e:
+        raise pytest.UsageError(str(e)) from None
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_cmdline_main(config: pytest.Config) -> None:
+    """Apply the profile's worker count unless -n was given explicitly.
+
+    Skipped inside xdist workers: they reset numprocesses and run this hook
+    again, and would otherwise start workers of their own.
+    """
+    if hasattr(config, "workerinput"):
+        return
+    profile = _selected_profile(config)
+    if profile.workers and config.pluginmanager.hasplugin("xdist") and config.option.numprocesses is None:
+        config.option.numprocesses = profile.workers
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo):
+    """Store each phase's report on the item and take the profile's screenshot.
+
+    The screenshot is taken here rather than in `page` teardown because page
+    object fixtures reset the app before the page is torn down.
+    """
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
+
+    page = item.funcargs.get("page")
+    profile = item.funcargs.get("perf_profile")
+    if report.when != "call" or page is None or profile is None:
+        return
+    screenshot = profile.artifacts.screenshot
+    if screenshot == "on" or (screenshot == "only-on-failure" and report.failed):
+        try:
+            page.screenshot(path=str(_artifact_dir(item.nodeid, profile) / "screenshot.png"), full_page=True)
+        except Exception as e:
+            # The page or browser may have crashed or closed, which is often why the test failed
+            print(f"Warning: Could not take screenshot for {item.nodeid}: {e}")
+
+def _test_failed(request: pytest.FixtureRequest) -> bool:
+    """Whether the current test failed during setup or call."""
+    return any(
+        getattr(request.node, f"rep_{when}", None) is not None and getattr(request.node, f"rep_{when}").failed
+        for when in ("setup", "call")
+    )
+
+def _artifact_dir(nodeid: str, profile: PerformanceProfile) -> Path:
+    """Per-test artifact directory under the profile's output dir."""
+    return Path(profile.artifacts.output_dir) / re.sub(r"[^\w.-]+", "-", nodeid).strip("-")
+
+@pytest.fixture(scope="session")
+def perf_profile(pytestconfig) -> PerformanceProfile:
+    """The selected performance profile; also applies its expect() timeout."""
+    profile = _selected_profile(pytestconfig)
+    expect.set_options(timeout=profile.expect_timeout)
+    return profile
+
+@pytest.fixture(scope="session")
+def virtual_clock(pytestconfig, perf_profile: PerformanceProfile) -> bool:
+    """Whether pages run with the virtual clock and animations disabled."""
+    return pytestconfig.getoption("virtual_clock") or perf_profile.virtual_clock
 
 @pytest.fixture(scope="session")
-def browser_context_args(browser_context_args: Dict) -> Dict:
+def browser_context_args(browser_context_args: Dict, perf_profile: PerformanceProfile) -> Dict:
     """Override browser context args for all browsers."""
     return {
         **browser_context_args,
-        "viewport": {
-            "width": 1280,
-            "height": 720,
-        },
-        # Video recording is handled by pytest-playwright's --video option
+        "viewport": perf_profile.viewport,
+        # Video recording follows the profile's artifact policy, see `context`
     }
 
 @pytest.fixture(scope="session")
@@ -26,27 +113,55 @@ def browser_type(playwright: Playwright) -> str:
     return "chromium"
 
 @pytest.fixture(scope="session")
-def browser(playwright: Playwright, browser_type: str, pytestconfig) -> Generator[Browser, None, None]:
-    """Fixture for creating a browser instance respecting --headed and --slowmo."""
-    slowmo = pytestconfig.getoption("slowmo")
-    headed = pytestconfig.getoption("headed")
+def browser(playwright: Playwright, browser_type: str, pytestconfig, perf_profile: PerformanceProfile) -> Generator[Browser, None, None]:
+    """Fixture for creating a browser instance from the profile.
+
+    --headed and a non-zero --slowmo override the profile; they cannot make a
+    headed profile headless or remove its slow_mo.
+    """
+    slowmo = pytestconfig.getoption("slowmo") or perf_profile.slow_mo
+    headed = pytestconfig.getoption("headed") or not perf_profile.headless
     browser_instance = getattr(playwright, browser_type).launch(
         headless=not headed,
-        slow_mo=slowmo
+        slow_mo=slowmo,
+        args=list(perf_profile.launch_args),
     )
     yield browser_instance
     browser_instance.close()
 
 @pytest.fixture
-def context(browser: Browser, browser_context_args: Dict) -> Generator[BrowserContext, None, None]:
-    """Fixture for creating a browser context."""
-    context = browser.new_context(**browser_context_args)
+def context(browser: Browser, browser_context_args: Dict, perf_profile: PerformanceProfile, request: pytest.FixtureRequest) -> Generator[BrowserContext, None, None]:
+    """Fixture for creating a browser context with the profile's blocking, timeouts and tracing."""
+    artifacts = perf_profile.artifacts
+    context_args = dict(browser_context_args)
+    if artifacts.video != "off":
+        context_args["record_video_dir"] = str(_artifact_dir(request.node.nodeid, perf_profile))
+    context = browser.new_context(**context_args)
+    context.set_default_timeout(perf_profile.action_timeout)
+
+    if perf_profile.blocked_urls:
+        # Only matching URLs reach the handler; note any route disables the HTTP cache
+        context.route(re.compile(perf_profile.blocked_urls), lambda route: route.abort())
+
+    if artifacts.tracing != "off":
+        context.tracing.start(screenshots=True, snapshots=True, sources=True)
+
     yield context
+
+    if artifacts.tracing == "on" or (artifacts.tracing == "retain-on-failure" and _test_failed(request)):
+        context.tracing.stop(path=str(_artifact_dir(request.node.nodeid, perf_profile) / "trace.zip"))
+    elif artifacts.tracing != "off":
+        context.tracing.stop()
     context.close()
 
 @pytest.fixture
-def page(context: BrowserContext) -> Generator[Page, None, None]:
-    """Fixture for creating a page instance."""
+def page(context: BrowserContext, virtual_clock: bool, perf_profile: PerformanceProfile, request: pytest.FixtureRequest) -> Generator[Page, None, None]:
+    """Fixture for creating a page instance, with the virtual clock if enabled."""
     page = context.new_page()
+    if virtual_clock:
+        install_virtual_clock(page)
     yield page
-    page.close()
\ No newline at end of file
+    video = page.video
+    page.close()
+    if video and perf_profile.artifacts.video == "retain-on-failure" and not _test_failed(request):
+        video.delete()
@@ -5,18 +5,19 @@ import pytest
 from pages.todo_page import CoolTodoPage
 from pages.add_task_page import AddTaskPage
 from config.config import BASE_URL
+from utils.virtual_clock import install_virtual_clock
 
-@pytest.fixture
-def todo_page(page: Page) -> Generator[CoolTodoPage, None, None]:
-    """Fixture that returns a configured CoolTodoPage instance.
+def _todo_page(page: Page, virtual_clock: bool) -> Generator[CoolTodoPage, None, None]:
+    """Shared setup and cleanup for the CoolTodoPage fixtures.
     
     Args:
-        page: The Playwright page object
+        page: The Playwright page object, with the virtual clock installed if `virtual_clock`
+        virtual_clock: Whether fixed waits are fast-forwarded on the virtual clock
         
     Yields:
         CoolTodoPage: A configured todo page object
     """
-    page_object = CoolTodoPage(page)
+    page_object = CoolTodoPage(page, virtual_clock=virtual_clock)
     # Navigate to the app
     page_object.goto(BASE_URL)
     
@@ -28,16 +29,45 @@ def todo_page(page: Page) -> Generator[CoolTodoPage, None, None]:
     page_object.page.reload()
 
 @pytest.fixture
-def add_task_page(page: Page) -> Generator[AddTaskPage, None, None]:
+def todo_page(page: Page, virtual_clock: bool) -> Generator[CoolTodoPage, None, None]:
+    """Fixture that returns a configured CoolTodoPage instance.
+    
+    Args:
+        page: The Playwright page object
+        virtual_clock: Whether fixed waits are fast-forwarded on the virtual clock
+        
+    Yields:
+        CoolTodoPage: A configured todo page object
+    """
+    yield from _todo_page(page, virtual_clock)
+
+@pytest.fixture
+def clock_todo_page(page: Page, virtual_clock: bool) -> Generator[CoolTodoPage, None, None]:
+    """Fixture that returns a CoolTodoPage running on the virtual clock regardless of --virtual-clock.
+    
+    Args:
+        page: The Playwright page object
+        virtual_clock: Whether the page fixture already installed the virtual clock
+        
+    Yields:
+        CoolTodoPage: A todo page object with the virtual clock installed
+    """
+    if not virtual_clock:
+        install_virtual_clock(page)
+    yield from _todo_page(page, virtual_clock=True)
+
+@pytest.fixture
+def add_task_page(page: Page, virtual_clock: bool) -> Generator[AddTaskPage, None, None]:
     """Fixture that returns a configured AddTaskPage instance.
     
     Args:
         page: The Playwright page object
+        virtual_clock: Whether fixed waits are fast-forwarded on the virtual clock
         
     Yields:
         AddTaskPage: A configured add task page object
     """
-    page_object = AddTaskPage(page)
+    page_object = AddTaskPage(page, virtual_clock=virtual_clock)
     # Navigate to the add task page
     page_object.goto(BASE_URL)
     
@@ -0,0 +1,39 @@
+import sys
+import os
+from types import SimpleNamespace
+from typing import Optional
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from tests.conftest import pytest_cmdline_main
+
+
+class TestPerfProfiles:
+    """Checks how performance profiles are applied to the pytest run."""
+
+    def fake_config(self, profile: str, worker: bool) -> SimpleNamespace:
+        """Builds the minimal config pytest_cmdline_main reads, optionally as an xdist worker."""
+        config = SimpleNamespace(
+            getoption=lambda name: profile if name == "perf_profile" else None,
+            pluginmanager=SimpleNamespace(hasplugin=lambda name: name == "xdist"),
+            option=SimpleNamespace(numprocesses=None),
+        )
+        if worker:
+            config.workerinput = {"workerid": "gw0"}
+        return config
+
+    def run_hook(self, profile: str, worker: bool) -> Optional[object]:
+        """Runs the hook and returns the resulting worker count."""
+        config = self.fake_config(profile, worker)
+        pytest_cmdline_main(config)
+        return config.option.numprocesses
+
+    def test_profile_sets_worker_count_on_controller(self) -> None:
+        """Verify a parallel profile sets xdist's worker count on the controller"""
+        assert self.run_hook("ci-fast", worker=False) == "auto"
+        assert self.run_hook("soak", worker=False) == 4
+
+    def test_profile_does_not_spawn_workers_inside_worker(self) -> None:
+        """Verify the hook does nothing inside an xdist worker, so workers do not spawn workers"""
+        assert self.run_hook("ci-fast", worker=True) is None
+        assert self.run_hook("soak", worker=True) is None
@@ -0,0 +1,131 @@
+import pytest
+import sys
+import os
+from typing import Dict, List, Optional
+from playwright.sync_api import Locator, expect
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from pages.todo_page import CoolTodoPage
+from pages.delete_task_dialog import DeleteTaskDialog
+from tests.fixtures.page_fixtures import todo_page
+from utils.selector_profiler import (
+    CHEAPER_SELECTORS,
+    REPLACEMENT_SELECTORS,
+    SelectorProfiler,
+    cheaper_task_locator,
+    collect_locators,
+    format_report,
+)
+
+PROFILE_TITLE = "Profiled Task"
+
+# Candidates grouped by the page state in which their originals match something
+LIST_CANDIDATES = ["task_count_text", "get_task_locator"]
+MENU_CANDIDATES = ["menu_complete_item", "menu_pending_item", "menu_edit_item", "menu_delete_item"]
+PURGE_DIALOG_CANDIDATES = ["confirm_purge_dialog", "confirm_purge_button"]
+EMPTY_LIST_CANDIDATES = ["no_tasks_message"]
+
+
+@pytest.fixture
+def task_counts(pytestconfig) -> List[int]:
+    """Task list sizes to profile at, from --profile-task-counts."""
+    return sorted(int(n) for n in pytestconfig.getoption("profile_task_counts").split(","))
+
+
+@pytest.mark.profiling
+class TestSelectorProfile:
+    """Profiles page-object locator cost against growing task lists."""
+
+    seeded = 0
+
+    def seed_tasks(self, todo_page: CoolTodoPage, count: int) -> None:
+        """Grows the list to `count` tasks, resetting first if it is already larger.
+
+        The first task is `PROFILE_TITLE`, so larger lists are seeded incrementally.
+        """
+        if count < self.seeded or count == 0:
+            todo_page.clear_storage_and_reload()
+            self.seeded = 0
+        titles = [PROFILE_TITLE if i == 0 else f"Seed Task {i}" for i in range(self.seeded, count)]
+        todo_page.add_tasks([{'title': title} for title in titles], fast=True)
+        self.seeded = count
+
+    def declared_locators(self, todo_page: CoolTodoPage) -> Dict[str, Locator]:
+        """Collects the locators declared by the page objects, plus a task card lookup."""
+        locators = collect_locators(todo_page)
+        locators.update(collect_locators(DeleteTaskDialog(todo_page.page)))
+        locators["get_task_locator"] = todo_page.get_task_locator(PROFILE_TITLE)
+        return locators
+
+    def check_in_states(
+        self,
+        todo_page: CoolTodoPage,
+        profiler: SelectorProfiler,
+        locators: Dict[str, Locator],
+        candidates: Dict[str, Locator],
+    ) -> Dict[str, Optional[bool]]:
+        """Checks each candidate with the menu or dialog its original needs open."""
+        def check(names: List[str]) -> Dict[str, Optional[bool]]:
+            return profiler.suggest(locators, {name: candidates[name] for name in names if name in candidates})
+
+        page = todo_page.page
+        equivalence = check(LIST_CANDIDATES)
+
+        todo_page.open_task_menu(PROFILE_TITLE)
+        equivalence.update(check(MENU_CANDIDATES))
+        page.keyboard.press('Escape')  # Close the task menu
+        expect(page.locator('ul[role="menu"]')).to_be_hidden()
+
+        todo_page.sidebar_button.click()
+        todo_page.sidebar_purge_tasks_link.click()
+        expect(todo_page.confirm_purge_dialog).to_be_visible()
+        equivalence.update(check(PURGE_DIALOG_CANDIDATES))
+        page.keyboard.press('Escape')  # Dismiss the purge dialog
+        expect(todo_page.confirm_purge_dialog).to_be_hidden()
+        page.keyboard.press('Escape')  # Close the sidebar
+
+        self.seed_tasks(todo_page, 0)
+        equivalence.update(check(EMPTY_LIST_CANDIDATES))
+        return equivalence
+
+    def test_profile_page_object_locators(self, todo_page: CoolTodoPage, task_counts: List[int]) -> None:
+        """Ranks locators by resolution cost and checks cheaper equivalents."""
+        profiler = SelectorProfiler(todo_page.page)
+        locators = self.declared_locators(todo_page)
+        candidates = {
+            name: factory(todo_page.page)
+            for name, factory in CHEAPER_SELECTORS.items()
+            if name in locators
+        }
+        candidates["get_task_locator"] = cheaper_task_locator(todo_page.page, PROFILE_TITLE)
+        replacements = {
+            name: factory(todo_page.page)
+            for name, factory in REPLACEMENT_SELECTORS.items()
+            if name in locators
+        }
+
+        profiles = profiler.profile_across(
+            {
+                **locators,
+                **{f"{name} (cheaper)": loc for name, loc in candidates.items()},
+                **{f"{name} (replacement, not equivalent)": loc for name, loc in replacements.items()},
+            },
+            task_counts,
+            lambda count: self.seed_tasks(todo_page, count),
+        )
+        # Equivalence needs at least one task on the page for the menu and dialogs
+        self.seed_tasks(todo_page, max(task_counts[-1], 1))
+        equivalence = self.check_in_states(todo_page, profiler, locators, candidates)
+        print("\n" + format_report(profiles, equivalence))
+
+        assert len(profiles) == len(task_counts) * (len(locators) + len(candidates) + len(replacements))
+        assert equivalence["get_task_locator"]
+        # A suggestion that matches different elements fails the run; None means the
+        # original matched nothing in that state (e.g. 'Pending' on a pending task)
+        mismatched = [name for name, equivalent in equivalence.items() if equivalent is False]
+        assert not mismatched, f"Cheaper selectors not equivalent: {', '.join(mismatched)}"
+        assert equivalence["task_count_text"] is not None
+        assert equivalence["menu_delete_item"] is not None
+        assert equivalence["confirm_purge_dialog"] is not None
+        assert equivalence["no_tasks_message"] is not None
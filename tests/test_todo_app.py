@@ -7,7 +7,8 @@ from playwright.sync_api import expect
 # Add the project root to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from pages.todo_page import CoolTodoPage
-from tests.fixtures.page_fixtures import todo_page, add_task_page
+from pages.add_task_page import AddTaskPage
+from tests.fixtures.page_fixtures import todo_page, add_task_page, clock_todo_page
 
 
 class TestTodoApp:
@@ -98,4 +99,79 @@ class TestTodoApp:
         todo_page.search_tasks("XYZ_NOMATCH_ZYX")
 
         # Expected result: Empty state message is displayed
-        todo_page.expect_no_tasks()
\ No newline at end of file
+        todo_page.expect_no_tasks()
+
+    def test_add_task_fast_fill(self, todo_page: CoolTodoPage) -> None:
+        """Verify the single-call form fill populates React state and creates the task"""
+        task_title = self.generate_unique_title("Fast Fill Task")
+        task_description = "Created through the in-page form fill"
+
+        # Fill and submit the /add form in one call, verifying values before submit
+        todo_page.navigate_to_add_task_page()
+        AddTaskPage(todo_page.page, virtual_clock=todo_page.virtual_clock).add_complete_task(
+            task_title, task_description, deadline="2030-01-01T12:00", fast=True, verify=True
+        )
+
+        # Expected result: Task appears with its description
+        todo_page.expect_task_visible(task_title, task_description)
+
+    @pytest.mark.parametrize("fast", [False, True], ids=["form", "fast-fill"])
+    def test_add_task_with_category_and_color(self, todo_page: CoolTodoPage, fast: bool) -> None:
+        """Verify category and color are applied through both the form and the fast fill"""
+        task_title = self.generate_unique_title("Category Color Task")
+
+        # Fill every field with a category and non-default color, verifying before submit
+        todo_page.navigate_to_add_task_page()
+        AddTaskPage(todo_page.page, virtual_clock=todo_page.virtual_clock).add_complete_task(
+            task_title,
+            "Task with category and color",
+            deadline="2030-01-01T12:00",
+            color_index=3,
+            category="Work",
+            fast=fast,
+            verify=True,
+        )
+
+        # Expected result: Task appears with its category
+        expect(todo_page.get_task_locator(task_title)).to_contain_text("Work")
+
+    def test_virtual_clock_fast_forwards_and_disables_transitions(self, clock_todo_page: CoolTodoPage) -> None:
+        """Verify the virtual clock fast-forwards page time and transitions are turned off"""
+        page = clock_todo_page.page
+
+        # Page time jumps ahead without waiting in real time
+        before = page.evaluate("() => Date.now()")
+        page.clock.run_for(60000)
+        assert page.evaluate("() => Date.now()") - before >= 60000
+
+        # Transitions on MUI buttons are forced to zero duration
+        duration = clock_todo_page.add_task_button.evaluate("el => getComputedStyle(el).transitionDuration")
+        assert all(part.strip() == "0s" for part in duration.split(","))
+
+        # Search filtering still settles with its wait fast-forwarded
+        clock_todo_page.add_task(self.generate_unique_title("Clock Task"))
+        clock_todo_page.search_tasks("XYZ_NOMATCH_ZYX")
+        clock_todo_page.expect_no_tasks()
+
+    def test_task_stream_tracks_list_changes(self, todo_page: CoolTodoPage) -> None:
+        """Verify the local task list model follows adds, searches and deletes"""
+        task_list = todo_page.attach_task_stream()
+        kept_title = self.generate_unique_title("Stream_Kept")
+        deleted_title = self.generate_unique_title("Stream_Deleted")
+
+        # Adds are reported as change events and reflected in the model
+        todo_page.add_task(kept_title)
+        todo_page.add_task(deleted_title)
+        assert {kept_title, deleted_title} <= set(task_list.titles())
+        assert any(change.kind == "added" and change.title == deleted_title for change in task_list.drain())
+
+        # Search filtering hides the non-matching task in the model
+        todo_page.search_tasks("Kept")
+        task_list.wait_for_task(deleted_title, visible=False)
+        task_list.wait_for_task(kept_title)
+        todo_page.clear_search()
+
+        # Deletion removes the task from the model
+        todo_page.delete_task(deleted_title)
+        task_list.wait_for_task(deleted_title, visible=False)
+        assert task_list.get(deleted_title) is None
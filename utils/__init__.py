@@ -0,0 +1 @@
+"""Helper utilities for the test automation framework."""
@@ -0,0 +1,220 @@
+"""Selector cost profiler for page-object locators."""
+import re
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional
+from playwright.sync_api import Locator, Page
+
+# Cheaper equivalents for the expensive locators declared in the page objects.
+# Keys are page-object attribute names; every suggestion is checked against the
+# original with `SelectorProfiler.check_equivalent` before it is trusted. Menu and
+# dialog locators only match while that menu or dialog is open, so they must be
+# checked in that state.
+CHEAPER_SELECTORS: Dict[str, Callable[[Page], Locator]] = {
+    "task_count_text": lambda page: page.get_by_role("heading", level=4, name="You have"),
+    "confirm_purge_dialog": lambda page: page.get_by_role("dialog", name="Delete All Tasks"),
+    "confirm_purge_button": lambda page: page.get_by_role("dialog").get_by_role("button", name="Delete All"),
+    "menu_complete_item": lambda page: page.get_by_role("menuitem", name="Complete"),
+    "menu_pending_item": lambda page: page.get_by_role("menuitem", name="Pending"),
+    "menu_edit_item": lambda page: page.get_by_role("menuitem", name="Edit"),
+    "menu_delete_item": lambda page: page.get_by_role("menuitem", name="Delete"),
+    "no_tasks_message": lambda page: page.get_by_text(
+        re.compile(r"^(No tasks completed yet|Add your first task|No tasks found)$")
+    ),
+}
+
+# Cheaper replacements that are NOT equivalent to the original and would change
+# what the page object matches; profiled for comparison, never equivalence-checked.
+REPLACEMENT_SELECTORS: Dict[str, Callable[[Page], Locator]] = {
+    # DeleteTaskDialog: 'div:has-text("Delete Task") >> visible=true' matches every
+    # visible ancestor div of the dialog; the replacement matches the dialog only
+    "dialog_strategy_2": lambda page: page.get_by_role("dialog", name="Delete Task"),
+}
+
+
+def cheaper_task_locator(page: Page, title: str) -> Locator:
+    """Cheaper equivalent of `CoolTodoPage.get_task_locator`.
+
+    Restricts the text scan to the card title instead of the whole card.
+    """
+    return page.get_by_test_id("task-container").filter(has=page.locator("h3", has_text=title))
+
+
+@dataclass
+class LocatorProfile:
+    """Resolution cost of a single locator at a given task list size."""
+
+    name: str
+    selector: str
+    task_count: int
+    match_count: int
+    median_ms: float
+    max_ms: float
+
+
+def selector_of(locator: Locator) -> str:
+    """Returns the selector string a locator resolves, for reporting."""
+    impl = getattr(locator, "_impl_obj", None)
+    selector = getattr(impl, "_selector", None)
+    return selector if isinstance(selector, str) else repr(locator)
+
+
+def collect_locators(page_object: object) -> Dict[str, Locator]:
+    """Returns every `Locator` attribute declared on a page object.
+
+    DeleteTaskDialog keeps its dialog strategies in a private list; those are
+    collected as `dialog_strategy_<n>`.
+    """
+    locators: Dict[str, Locator] = {}
+    for name, value in vars(page_object).items():
+        if isinstance(value, Locator):
+            locators[name] = value
+        elif name == "_dialog_locators":
+            for index, locator in enumerate(value):
+                locators[f"dialog_strategy_{index}"] = locator
+    return locators
+
+
+class SelectorProfiler:
+    """Measures locator resolution time and match counts on a live page.
+
+    Each measurement is a `count()` round trip; the cost of an empty round trip
+    (`page.evaluate("1")`) is measured once per run and subtracted so that the
+    numbers reflect selector resolution rather than protocol overhead.
+    """
+
+    def __init__(self, page: Page, repeats: int = 5):
+        self.page = page
+        self.repeats = repeats
+
+    def _time_ms(self, action: Callable[[], object]) -> List[float]:
+        """Runs an action `repeats` times and returns the timings in ms."""
+        timings = []
+        for _ in range(self.repeats):
+            start = time.perf_counter()
+            action()
+            timings.append((time.perf_counter() - start) * 1000)
+        return timings
+
+    def measure_overhead(self) -> float:
+        """Returns the median cost of an empty round trip in ms."""
+        return statistics.median(self._time_ms(lambda: self.page.evaluate("1")))
+
+    def profile(self, locators: Dict[str, Locator], task_count: int) -> List[LocatorProfile]:
+        """Profiles each locator against the current page state."""
+        overhead = self.measure_overhead()
+        profiles = []
+        for name, locator in locators.items():
+            timings = [max(t - overhead, 0.0) for t in self._time_ms(locator.count)]
+            profiles.append(LocatorProfile(
+                name=name,
+                selector=selector_of(locator),
+                task_count=task_count,
+                match_count=locator.count(),
+                median_ms=statistics.median(timings),
+                max_ms=max(timings),
+            ))
+        return profiles
+
+    def profile_across(
+        self,
+        locators: Dict[str, Locator],
+        task_counts: Iterable[int],
+        seed: Callable[[int], None],
+    ) -> List[LocatorProfile]:
+        """Seeds the page with each task count in turn and profiles the locators.
+
+        Args:
+            locators: Locators to profile, keyed by name
+            task_counts: Task list sizes to profile at
+            seed: Callback that puts exactly `n` tasks on the page
+
+        Returns:
+            List[LocatorProfile]: One profile per locator per task count
+        """
+        profiles: List[LocatorProfile] = []
+        for task_count in task_counts:
+            seed(task_count)
+            profiles.extend(self.profile(locators, task_count))
+        return profiles
+
+    def check_equivalent(self, original: Locator, candidate: Locator) -> Optional[bool]:
+        """Checks that two locators match exactly the same elements.
+
+        Elements matched by the original are tagged in-page, then the candidate's
+        matches are read back; the tags are removed afterwards.
+
+        Returns:
+            Optional[bool]: None if the original matches nothing, since equivalence
+            cannot be verified in that state
+        """
+        marker = "data-selector-profiler"
+        original.evaluate_all(
+            "(els, marker) => els.forEach((el, i) => el.setAttribute(marker, String(i)))",
+            marker,
+        )
+        try:
+            original_count = original.count()
+            tagged = candidate.evaluate_all(
+                "(els, marker) => els.map(el => el.getAttribute(marker))",
+                marker,
+            )
+        finally:
+            self.page.evaluate(
+                "marker => document.querySelectorAll(`[${marker}]`).forEach(el => el.removeAttribute(marker))",
+                marker,
+            )
+        if original_count == 0:
+            return None
+        matched = sorted(tag for tag in tagged if tag is not None)
+        return len(tagged) == original_count and matched == sorted(str(i) for i in range(original_count))
+
+    def suggest(
+        self,
+        locators: Dict[str, Locator],
+        candidates: Optional[Dict[str, Locator]] = None,
+    ) -> Dict[str, Optional[bool]]:
+        """Checks the cheaper candidate for each profiled locator in the current page state.
+
+        Args:
+            locators: Locators to find cheaper equivalents for, keyed by name
+            candidates: Candidate locators by name; defaults to `CHEAPER_SELECTORS`
+
+        Returns:
+            Dict[str, Optional[bool]]: Whether each candidate matched the same
+            elements, or None where the original matched nothing
+        """
+        if candidates is None:
+            candidates = {
+                name: factory(self.page)
+                for name, factory in CHEAPER_SELECTORS.items()
+                if name in locators
+            }
+        return {
+            name: self.check_equivalent(locators[name], candidate)
+            for name, candidate in candidates.items()
+            if name in locators
+        }
+
+
+def rank(profiles: List[LocatorProfile]) -> List[LocatorProfile]:
+    """Ranks profiles by resolution cost, most expensive first."""
+    return sorted(profiles, key=lambda p: (p.median_ms, p.max_ms), reverse=True)
+
+
+def format_report(profiles: List[LocatorProfile], equivalence: Optional[Dict[str, Optional[bool]]] = None) -> str:
+    """Formats ranked profiles as a plain-text table."""
+    equivalence = equivalence or {}
+    lines = [f"{'locator':<28} {'tasks':>5} {'matches':>7} {'median ms':>9} {'max ms':>8}  cheaper equivalent"]
+    for p in rank(profiles):
+        if p.name in equivalence and equivalence[p.name] is None:
+            suggestion = "unverified"
+        elif p.name in equivalence:
+            suggestion = "ok" if equivalence[p.name] else "MISMATCH"
+        else:
+            suggestion = "-"
+        lines.append(
+            f"{p.name:<28} {p.task_count:>5} {p.match_count:>7} {p.median_ms:>9.2f} {p.max_ms:>8.2f}  {suggestion}"
+        )
+    return "\n".join(lines)
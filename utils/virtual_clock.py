@@ -0,0 +1,53 @@
+"""Virtual clock and animation suppression for deterministic UI waits."""
+from playwright.sync_api import Page
+
+# Longest MUI transition the app uses (menus, drawer, dialogs). The transition
+# components unmount on a timer even when CSS transitions are disabled.
+MUI_TRANSITION_MS = 300
+
+DISABLE_ANIMATIONS_SCRIPT = """
+(() => {
+    const style = document.createElement('style');
+    style.textContent = `
+        *, *::before, *::after {
+            transition-duration: 0s !important;
+            transition-delay: 0s !important;
+            animation-duration: 0s !important;
+            animation-delay: 0s !important;
+            animation-iteration-count: 1 !important;
+            scroll-behavior: auto !important;
+        }
+    `;
+    const inject = () => (document.head || document.documentElement).appendChild(style);
+    if (document.documentElement) {
+        inject();
+    } else {
+        document.addEventListener('DOMContentLoaded', inject);
+    }
+})();
+"""
+
+
+def install_virtual_clock(page: Page) -> None:
+    """Installs Playwright's clock and turns off transitions and animations.
+
+    Must be called before the first navigation. Time keeps flowing naturally;
+    page objects fast-forward debounces and timers with `advance`.
+    """
+    page.clock.install()
+    page.emulate_media(reduced_motion="reduce")
+    page.add_init_script(DISABLE_ANIMATIONS_SCRIPT)
+
+
+def advance(page: Page, ms: int, virtual_clock: bool) -> None:
+    """Lets `ms` of page time pass: fast-forwarded with the virtual clock, waited otherwise."""
+    if virtual_clock:
+        page.clock.run_for(ms)
+    else:
+        page.wait_for_timeout(ms)
+
+
+def fast_forward_transitions(page: Page, virtual_clock: bool) -> None:
+    """Fires pending MUI transition timers; a no-op without the virtual clock."""
+    if virtual_clock:
+        page.clock.run_for(MUI_TRANSITION_MS)